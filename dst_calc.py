@@ -4,12 +4,13 @@ Determines if Daylight Savings Time is in effect for a given date.
 Uses the US rules, i.e., DST is in effect from the second Sunday of 
 March until the first Sunday of November.
 '''
-from datetime import datetime, timedelta
+from datetime import date
+from functools import lru_cache
 
 def main() -> None:
 
-    today = datetime.now()  # check if DST is in effect today
-    # today = datetime(2025, 7, 1)  # manually specify the date for testing
+    today = date.today()  # check if DST is in effect today
+    # today = date(2025, 7, 1)  # manually specify the date for testing
 
     print(dst_in_effect(today.year, today.month, today.day))
 
@@ -18,28 +19,33 @@ def dst_in_effect(year: int, month: int, day: int) -> bool:
     '''
     Determines if DST is in effect in the U.S. for a given date.
     '''
-    dst_start = _second_sunday(year, 3)   # Second Sunday of March
-    dst_end = _first_sunday(year, 11)     # First Sunday of November
-    current_date = datetime(year, month, day)
-    
-    return dst_start <= current_date < dst_end
+    dst_start, dst_end = _dst_bounds(year)
 
-def _second_sunday(year: int, month: int) -> datetime:
+    return dst_start <= date(year, month, day).toordinal() < dst_end
+
+@lru_cache(maxsize=64)
+def _dst_bounds(year: int) -> tuple[int, int]:
     '''
-    Returns the date of the second Sunday of the given month and year.
+    Returns the ordinals of the first and last-plus-one days of DST for the given year.
     '''
-    first_day = datetime(year, month, 1)
-    first_sunday = first_day + timedelta(days=(6 - first_day.weekday()) % 7)
+    dst_start = date(year, 3, _second_sunday(year, 3)).toordinal()   # Second Sunday of March
+    dst_end = date(year, 11, _first_sunday(year, 11)).toordinal()    # First Sunday of November
 
-    return first_sunday + timedelta(weeks=1)
+    return dst_start, dst_end
 
-def _first_sunday(year: int, month: int) -> datetime:
+def _first_sunday(year: int, month: int) -> int:
     '''
-    Returns the date of the first Sunday of the given month and year.
+    Returns the day of the month of the first Sunday of the given month and year.
     '''
-    first_day = datetime(year, month, 1)
+    first_weekday = date(year, month, 1).weekday()  # Monday = 0
+
+    return 7 - first_weekday  # 0 <= first_weekday <= 6, so no modulo is needed
 
-    return first_day + timedelta(days=(6 - first_day.weekday()) % 7)
+def _second_sunday(year: int, month: int) -> int:
+    '''
+    Returns the day of the month of the second Sunday of the given month and year.
+    '''
+    return _first_sunday(year, month) + 7
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -12,13 +12,11 @@ https://sffjunkie.github.io/astral/
 
 https://www.weather.gov/fsd/twilight
 
-Uses the pytz library to create timezone-aware datetime objects.
+Uses the zoneinfo module from the standard library to create timezone-aware datetime objects.
 
-https://pypi.org/project/pytz/
+https://docs.python.org/3/library/zoneinfo.html
 
-https://pypi.org/project/DateTime/
-
-https://pytutorial.com/python-pytz-time-zone-handling-made-easy/
+https://pypi.org/project/tzdata/
 '''
 
 from PySide6.QtGui import QIcon, QAction
@@ -28,40 +26,250 @@ from PySide6.QtWidgets import (
         QDialog, QLineEdit, QPushButton, QDateEdit,
         QTableWidget, QTableWidgetItem
 )
-from PySide6.QtCore import QDate, Qt
+from PySide6.QtCore import QDate, QObject, Qt, QRunnable, QThreadPool, QTimer, Signal
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.projections.polar import PolarAxes
+# matplotlib and astral are imported where they are first used, to shorten startup
 
 import numpy as np
 import sys
 import os
-from typing import cast, Optional
-from datetime import datetime
-import pytz
-from astral import LocationInfo
-from astral.sun import sun
+from typing import cast, NamedTuple, Optional
+from datetime import date, datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo, available_timezones
 
 # Icon filename
 icon_fname = 'bw.ico'
 
-# TODO: move inside DayLengthCalculator class ???
-def time_to_angle(value):
+# Delay (ms) used to coalesce repeated "Update plot" requests
+_UPDATE_DEBOUNCE_MS = 50
+
+# Shaded regions of the plot: (name, start event, end event, color, alpha)
+_WEDGES = (
+    ('daylight', 'sunrise', 'sunset', 'gold', 0.8),
+    ('civil_am', 'civil_dawn', 'sunrise', '#0073CF', 0.6),
+    ('civil_pm', 'sunset', 'civil_dusk', '#0073CF', 0.6),
+    ('nautical_am', 'nautical_dawn', 'civil_dawn', '#0000CD', 0.8),
+    ('nautical_pm', 'civil_dusk', 'nautical_dusk', '#0000CD', 0.8),
+    ('astro_am', 'astro_dawn', 'nautical_dawn', '#00008B', 0.8),
+    ('astro_pm', 'nautical_dusk', 'astro_dusk', '#00008B', 0.8),
+    ('night', 'astro_dusk', 'astro_dawn', '#00004B', 0.8),
+)
+
+class _Events(NamedTuple):
+    '''
+    Angles (radians) of the events shown in the plot, in the order they are calculated.
+    '''
+    noon: float
+    sunrise: float
+    sunset: float
+    civil_dawn: float
+    civil_dusk: float
+    nautical_dawn: float
+    nautical_dusk: float
+    astro_dawn: float
+    astro_dusk: float
+
+# Positions of each wedge's start and end events in an _Events-ordered array
+_WEDGE_STARTS = np.array([_Events._fields.index(wedge[1]) for wedge in _WEDGES])
+_WEDGE_STARTS.setflags(write=False)
+_WEDGE_ENDS = np.array([_Events._fields.index(wedge[2]) for wedge in _WEDGES])
+_WEDGE_ENDS.setflags(write=False)
+
+@lru_cache(maxsize=8)
+def _tz(name: str):
     '''
-    **Convert a time object to an angle in radians.**
+    **Return the (cached) timezone object for a TZ identifier.**
     '''
-    if isinstance(value, dict):
-        return {k: time_to_angle(v) for k, v in value.items()}  # Recursively process dicts
-    return (value.hour + value.minute / 60) / 24 * 2 * np.pi
+    return ZoneInfo(name)
 
+@lru_cache(maxsize=8)
+def _observer(latitude: float, longitude: float):
+    '''
+    **Return the (cached) astral observer for a location, reused by every sun calculation there.**
+    '''
+    from astral import Observer
 
-class BaseDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
+    return Observer(latitude, longitude)
+
+@lru_cache(maxsize=1)
+def _tz_names() -> frozenset:
+    '''
+    **Return the set of valid TZ identifiers, built once on first use.**
+    '''
+    return frozenset(available_timezones())
+
+@lru_cache(maxsize=512)
+def _sun_cached(latitude: float, longitude: float, ordinal: int, depression: float, tz_name: str) -> dict:
+    '''
+    **Return the (cached) astral sun events for a location, date and twilight depression angle.**
+
+    :param latitude: The latitude of the observer (°).
+    :type latitude: float
+    :param longitude: The longitude of the observer (°).
+    :type longitude: float
+    :param ordinal: The date, as returned by *date.toordinal()*.
+    :type ordinal: int
+    :param depression: The twilight depression angle (°).
+    :type depression: float
+    :param tz_name: The TZ identifier used for the returned times.
+    :type tz_name: str
+    :return: A dictionary of the sun events (dawn, sunrise, noon, sunset, dusk). Must not be modified.
+    :rtype: dict
+    '''
+    from astral.sun import sun
+
+    return sun(
+        _observer(latitude, longitude), 
+        date = date.fromordinal(ordinal), 
+        tzinfo = _tz(tz_name), 
+        dawn_dusk_depression = depression
+    )
+
+@lru_cache(maxsize=512)
+def _twilight_cached(latitude: float, longitude: float, ordinal: int, depression: float, tz_name: str) -> tuple:
+    '''
+    **Return the (cached) dawn and dusk times for a location, date and twilight depression angle.**
+
+    Only the dawn and dusk calculations are run, rather than the full set of sun events.
+
+    :param latitude: The latitude of the observer (°).
+    :type latitude: float
+    :param longitude: The longitude of the observer (°).
+    :type longitude: float
+    :param ordinal: The date, as returned by *date.toordinal()*.
+    :type ordinal: int
+    :param depression: The twilight depression angle (°).
+    :type depression: float
+    :param tz_name: The TZ identifier used for the returned times.
+    :type tz_name: str
+    :return: A tuple of the dawn and dusk times.
+    :rtype: tuple
+    '''
+    from astral.sun import dawn, dusk
+
+    observer = _observer(latitude, longitude)
+    target_date = date.fromordinal(ordinal)
+    tzinfo = _tz(tz_name)
+
+    return (
+        dawn(observer, date=target_date, depression=depression, tzinfo=tzinfo),
+        dusk(observer, date=target_date, depression=depression, tzinfo=tzinfo)
+    )
+
+def _get_sun_info(latitude: float, longitude: float, ordinal: int, depression: float, tz_name: str) -> Optional[dict]:
+    '''
+    **Get the sunrise, sunset, and twilight times, or *None* if they couldn't be calculated.**
+    '''
+    try:
+        return _sun_cached(latitude, longitude, ordinal, depression, tz_name)
+
+    except ValueError as e:
+        print(f"ValueError: {e}")
+        return None
+    except Exception as e:
+        print(f"Error: {e}")
+        return None
+
+def _get_twilight_times(latitude: float, longitude: float, ordinal: int, depression: float, tz_name: str) -> Optional[tuple]:
+    '''
+    **Get the dawn and dusk times for the given twilight depression angle, or *None* if they couldn't be calculated.**
+    '''
+    try:
+        return _twilight_cached(latitude, longitude, ordinal, depression, tz_name)
+
+    except ValueError as e:
+        print(f"ValueError: {e}")
+        return None
+    except Exception as e:
+        print(f"Error: {e}")
+        return None
+
+# Angle of every minute of the day, for converting (whole-minute) event times by table lookup
+_MINUTE_ANGLES = np.linspace(0, 2*np.pi, 1440, endpoint=False)
+_MINUTE_ANGLES.setflags(write=False)
+
+# Hour tick positions and labels (24-hour format)
+_HOUR_ANGLES = np.linspace(0, 2*np.pi, 24, endpoint=False)
+_HOUR_ANGLES.setflags(write=False)
+_HOUR_LABELS = tuple(f"{h}:00" for h in range(24))
+
+# Hour tick marks slightly outside the filled area, as (theta, r) segment endpoints
+_HOUR_TICK_SEGMENTS = np.empty((24, 2, 2))
+_HOUR_TICK_SEGMENTS[:, :, 0] = _HOUR_ANGLES[:, np.newaxis]  # theta
+_HOUR_TICK_SEGMENTS[:, 0, 1] = 1  # inner radius
+_HOUR_TICK_SEGMENTS[:, 1, 1] = 1.05  # outer radius
+_HOUR_TICK_SEGMENTS.setflags(write=False)
+
+# Outer circle of the plot at r = 1.05
+_OUTER_THETA = np.linspace(0, 2*np.pi, 100)
+_OUTER_THETA.setflags(write=False)
+_OUTER_R = np.full(100, 1.05)
+_OUTER_R.setflags(write=False)
+
+
+class _Warmup(QRunnable):
+    '''
+    **Run a throwaway solar calculation in a background thread so the first plot update is fast.**
+    '''
+    def run(self) -> None:
+        from astral import Observer
+        from astral.sun import sun
+        sun(Observer(0, 0), date=date(2024, 6, 21), tzinfo=_tz("UTC"))
+
+
+class _SunEventsSignals(QObject):
+    '''
+    **Carries the results of a _SunEventsWorker back to the GUI thread.**
+
+    Emits the render key, the *sun()* results, and the event times in *_Events* order
+    (both *None* if the sun events couldn't be calculated).
+    '''
+    finished = Signal(object, object, object)
+
+
+class _SunEventsWorker(QRunnable):
+    '''
+    **Calculate the sun events for a location and date in a background thread, so the GUI stays responsive.**
+    '''
+    def __init__(self, signals: _SunEventsSignals, render_key: tuple, latitude: float, longitude: float, ordinal: int, tz_name: str):
+        super().__init__()
+        self.signals = signals
+        self.render_key = render_key
+        self.args = (latitude, longitude, ordinal)
+        self.tz_name = tz_name
+
+    def run(self) -> None:
+        # Get sunrise, sunset, solar noon, and civil twilight times from a single calculation
+        # (if the Sun never gets low enough for civil twilight, use the times for 0° instead)
+        civil_depression = 6  # Civil twilight angle
+        sun_info = _get_sun_info(*self.args, civil_depression, self.tz_name) or _get_sun_info(*self.args, 0, self.tz_name)
+        if sun_info is None:
+            self.signals.finished.emit(self.render_key, None, None)
+            return
+
+        # Collect the event times in _Events order (civil twilight is already in sun_info)
+        dawn, dusk = sun_info['dawn'], sun_info['dusk']
+        event_times = [sun_info['noon'], sun_info['sunrise'], sun_info['sunset'], dawn, dusk]
+
+        # Get only the dawn and dusk times for nautical and astronomical twilight
+        # (if they can't be calculated, e.g., the Sun never gets that low, reuse the previous ones)
+        for depression in (12, 18):
+            dawn, dusk = _get_twilight_times(*self.args, depression, self.tz_name) or (dawn, dusk)
+            event_times += (dawn, dusk)
+
+        self.signals.finished.emit(self.render_key, sun_info, event_times)
+
+
+class MessageMixin:
+    '''
+    **Provides *show_message* to the main window and the dialogs.**
+
+    The *QMessageBox* is created on first use and then reused for every later message.
+    '''
+    _msg_box: Optional[QMessageBox] = None
+    _msg_label: Optional[QLabel] = None
 
-    # todo: merge with version in DayLengthCalculator class ???
     def show_message(self, message: str, icon_type: QMessageBox.Icon) -> None:
         '''
         **Display a message using the *QMessageBox* class.**
@@ -71,26 +279,40 @@ class BaseDialog(QDialog):
         :param icon_type: The icon that appears in the box, *e.g.*, *QMessageBox.Warning*.
         :type icon_type: QMessageBox.Icon
         '''
-        msg_box = QMessageBox(self)
+        if self._msg_box is None:
+            msg_box = QMessageBox(self)  # type: ignore
+            msg_box.setWindowTitle("Day Length Calculator")
+
+            # Ensure text wraps properly
+            msg_box.setMinimumSize(300, 200)  # Adjust width/height as needed
+            msg_box.setSizeGripEnabled(True)  # Allow resizing
+
+            # Adjust the QLabel inside the message box
+            label = msg_box.findChild(QLabel, "qt_msgbox_label")
+            if label:
+                label.setMinimumWidth(200)
+                label.setWordWrap(True)
+
+            self._msg_box, self._msg_label = msg_box, label
+
+        msg_box = self._msg_box
         msg_box.setText(message)
         msg_box.setIcon(icon_type)
-        msg_box.setWindowTitle("Day Length Calculator")
-
-        # Ensure text wraps properly
-        msg_box.setMinimumSize(300, 200)  # Adjust width/height as needed
-        msg_box.setSizeGripEnabled(True)  # Allow resizing
-     
-        # Adjust the QLabel inside the message box
-        label = msg_box.findChild(QLabel, "qt_msgbox_label")
+
+        # Fit the box to the new text
+        label = self._msg_label
         if label:
-            label.setMinimumWidth(200)
-            label.setWordWrap(True)
             label.adjustSize()
             msg_box.resize(max(label.sizeHint().width() + 50, 200), msg_box.height())
 
         msg_box.exec()
 
 
+class BaseDialog(MessageMixin, QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+
 class TimeZoneDialog(BaseDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -190,7 +412,7 @@ class LocationDialog(BaseDialog):
             LocationDialog.last_longitude = float(self.lon_input.text())
             LocationDialog.last_location_name = self.loc_input.text().strip()
             tz_str = self.tz_input.text().strip()
-            if tz_str not in pytz.all_timezones:
+            if tz_str not in _tz_names():
                 raise ValueError("Invalid timezone input.")
             LocationDialog.last_tz_str = tz_str
             super().accept()
@@ -253,14 +475,16 @@ class DateEntryDialog(BaseDialog):
         return datetime(qdate.year(), qdate.month(), qdate.day())
 
 
-class DayLengthCalculator(QMainWindow):
+class DayLengthCalculator(MessageMixin, QMainWindow):
 
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Day Length Calculator")
 
         self.target_date = None
-        self.location = None
+        self.location_name = self.tz_str = ""
+        self.latitude = self.longitude = None
+        self.sun_info: dict = {}
 
         # Set the icon
         if getattr(sys, 'frozen', False):  # If bundled with PyInstaller
@@ -276,10 +500,28 @@ class DayLengthCalculator(QMainWindow):
         # Layout for the central widget
         layout = QVBoxLayout(central_widget)
 
-        # Matplotlib figure and canvas
+        # Matplotlib figure and canvas (simplify paths and render them in chunks, to keep Agg draws fast)
+        import matplotlib
+        matplotlib.rcParams.update({
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000,
+        })
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
+
         self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
+        self._build_static_plot()
+
+        # Warm up the solar calculations without blocking the GUI
+        QThreadPool.globalInstance().start(_Warmup())
+
+        # Sun events are calculated in background workers, which report back through this object
+        self._sun_signals = _SunEventsSignals(self)
+        self._sun_signals.finished.connect(self._apply_sun_events)
 
         # Add Matplotlib navigation toolbar
         self.toolbar = NavigationToolbar(self.canvas, self)
@@ -317,7 +559,7 @@ class DayLengthCalculator(QMainWindow):
         update_plot_action = QAction('Update plot', self)
         update_plot_action.setShortcut('Ctrl+U')
         update_plot_action.setStatusTip('Update the plot.')
-        update_plot_action.triggered.connect(self.update_plot)
+        update_plot_action.triggered.connect(self._request_update)
         menu.addAction(update_plot_action)
 
         # Show time zones action
@@ -334,33 +576,87 @@ class DayLengthCalculator(QMainWindow):
         exit_action.triggered.connect(self.close)
         menu.addAction(exit_action)
 
-    def show_message(self, message: str, icon_type: QMessageBox.Icon) -> None:
+    def _build_static_plot(self) -> None:
         '''
-        **Display a message using the *QMessageBox* class.**
+        **Create the polar axes and the artists that are reused by every plot update.**
 
-        :param message: The text that appears in the box.
-        :type message: str
-        :param icon_type: The icon that appears in the box, *e.g.*, *QMessageBox.Warning*.
-        :type icon_type: QMessageBox.Icon
+        The hour ticks, labels and outer circle never change. The shaded regions, the solar 
+        noon/midnight lines, and the title/footer text are created once here and then modified 
+        in place by *update_plot*.
         '''
-        msg_box = QMessageBox(self)
-        msg_box.setText(message)
-        msg_box.setIcon(icon_type)
-        msg_box.setWindowTitle("Day Length Calculator")
-
-        # Ensure text wraps properly
-        msg_box.setMinimumSize(300, 200)  # Adjust width/height as needed
-        msg_box.setSizeGripEnabled(True)  # Allow resizing
-     
-        # Adjust the QLabel inside the message box
-        label = msg_box.findChild(QLabel, "qt_msgbox_label")
-        if label:
-            label.setMinimumWidth(200)
-            label.setWordWrap(True)
-            label.adjustSize()
-            msg_box.resize(max(label.sizeHint().width() + 50, 200), msg_box.height())
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import to_rgba_array
+        from matplotlib.patches import Rectangle
+        from matplotlib.projections.polar import PolarAxes
 
-        msg_box.exec()
+        ax = self.figure.add_subplot(111, projection='polar')
+        self.ax = ax = cast(PolarAxes, ax)
+        ax.set_theta_zero_location('N')  # Midnight at top
+        ax.set_theta_direction(-1)  # Clockwise rotation
+
+        # Solar noon and midnight lines (hidden until the first update)
+        self._noon_line, = ax.plot([0, 0], [0, 1], color='white', linestyle=':', linewidth=2, alpha=0.8, visible=False)
+        self._midnight_line, = ax.plot([0, 0], [0, 1], color='black', linestyle=':', linewidth=2, alpha=0.8, visible=False)
+
+        # Shaded regions, created with a single bar call and initially with zero width
+        # (the colors and alphas are converted once to an RGBA table)
+        names, _, _, colors, alphas = zip(*_WEDGES)
+        wedge_rgba = to_rgba_array(colors, alpha=alphas)
+        bars = ax.bar(np.zeros(len(_WEDGES)), 1, width=0, color=wedge_rgba, align='edge')
+        self._wedges: dict[str, Rectangle] = dict(zip(names, bars))
+
+        # Set Hour Labels (24-hour format)
+        ax.set_xticks(_HOUR_ANGLES)
+        ax.set_xticklabels(_HOUR_LABELS, fontsize=9)
+
+        ax.set_yticks([])
+        ax.set_yticklabels([])
+        ax.yaxis.grid(False)
+        ax.xaxis.grid(False)
+
+        # Hour tick marks slightly outside the filled area, drawn as a single collection
+        ax.add_collection(LineCollection(_HOUR_TICK_SEGMENTS, colors='black', linewidths=0.8, linestyles='solid'))
+
+        # Draw the outer circle at r = 1.05
+        ax.plot(_OUTER_THETA, _OUTER_R, color='black', linewidth=1.2)
+
+        # Title and sunrise/sunset annotation, filled in by update_plot()
+        self._title = ax.set_title("", pad=35, fontsize=12)
+        # (the footer belongs to the axes, in figure coordinates, so that savefig() draws it along with the other animated artists)
+        self._footer_text = ax.text(0.5, 0.02, "", transform=self.figure.transFigure, ha='center', fontsize=11)
+
+        # Apply plot layout adjustments
+        self.figure.subplots_adjust(top=0.85, bottom=0.13, left=0.125, right=0.9, hspace=0.2, wspace=0.2)
+
+        # The artists that change are excluded from full redraws and blitted over the static background
+        # (drawn in z-order, so the noon/midnight lines stay on top of the shaded regions)
+        self._dynamic_artists = (
+            *self._wedges.values(), 
+            self._noon_line, 
+            self._midnight_line, 
+            self._title, 
+            self._footer_text
+        )
+        for artist in self._dynamic_artists:
+            artist.set_animated(True)
+
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        self._update_pending = False
+        self._last_render_key = None  # (date, location) shown by the last successful update
+        self._pending_render_key = None  # (date, location) whose sun events are being calculated
+
+    def _on_draw(self, event) -> None:
+        '''
+        **Capture the static background after a full redraw (*e.g.*, on resize), then draw the dynamic artists on top.**
+        '''
+        if self.canvas.is_saving():
+            return  # The axes draw their animated artists themselves when saving the figure
+
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self._dynamic_artists:
+            artist.draw(event.renderer)
 
     def show_time_zones(self):
         self.dialog = TimeZoneDialog(self)
@@ -385,180 +681,118 @@ class DayLengthCalculator(QMainWindow):
                 self.latitude = lat
                 self.longitude = lon
                 self.location_name = dialog.loc_input.text().strip()
-                self.region = ""
                 self.tz_str = dialog.tz_input.text().strip()
-                self.location = LocationInfo(
-                    self.location_name, 
-                    self.region, 
-                    self.tz_str, 
-                    self.latitude, 
-                    self.longitude
-                )
-                self.tz = pytz.timezone(self.location.timezone)  # pytz timezone object - see https://pypi.org/project/pytz/
             else:
                 message = "Invalid latitude/longitude input."
                 self.show_message(message, QMessageBox.Warning)  # type: ignore
  
-    def get_sun_info(self, twilight_depression: float):
-        # Get sunrise, sunset, and twilight times
-
-        if self.location is None:
-            self.show_message("No location selected.", QMessageBox.Warning) # type: ignore
-            return
+    def _request_update(self) -> None:
+        '''
+        **Schedule a plot update, so that a burst of requests (*e.g.*, holding down Ctrl+U) renders only once.**
+        '''
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(_UPDATE_DEBOUNCE_MS, self._do_update)
 
-        try:
-            self.sun_info: dict = sun(
-                self.location.observer, 
-                date = self.target_date, 
-                tzinfo = self.tz, 
-                dawn_dusk_depression = twilight_depression
-            )
-            # print(f"Sun info for depression angle {twilight_depression}: {self.sun_info}")  # ! Debug print
+    def _do_update(self) -> None:
+        self._update_pending = False
+        self.update_plot()
 
-        except ValueError as e:
-            print(f"ValueError: {e}")
-            return  # Exit the function
-        except Exception as e:
-            print(f"Error: {e}")
-            return  # Exit the function
-        
     def update_plot(self):
 
         if self.target_date is None:
             self.show_message("No date selected.", QMessageBox.Warning)  # type: ignore
             return
 
-        if self.location is None:
+        if self.latitude is None:
             self.show_message("No location selected.", QMessageBox.Warning) # type: ignore
             return
 
-        # Get sunrise, sunset, and solar noon times
-        self.get_sun_info(0)
-
-        # Store in a dictionary
-        event_times = {
-            'noon': self.sun_info.get('noon', None),
-            'sunrise': self.sun_info.get('sunrise', None),
-            'sunset': self.sun_info.get('sunset', None),
-        }
-
-        # Get the different twilight times
-        depression_angles = {
-            "dusk_civil": 6,  # Civil twilight angle
-            "dusk_nautical": 12,  # Nautical twilight angle
-            "dusk_astro": 18,  # Astronomical twilight angle
-        }
-
-        # Loop through the depression angles and call get_sun_info() for each
-        twilight_times = {}
-        for twilight_type, depression in depression_angles.items():
-            self.get_sun_info(twilight_depression=depression)
-            
-            # Store the dawn and dusk times for the current twilight type
-            twilight_times[twilight_type] = {
-                'dawn': self.sun_info.get('dawn', None),
-                'dusk': self.sun_info.get('dusk', None)
-            }
-
-        # Combine the two dictionaries
-        sun_data = {**event_times, **twilight_times}
-
-        # Convert standard solar times (sunrise, sunset, noon) to angles
-        angles = {}
-        angles.update({k: time_to_angle(v.time()) for k, v in sun_data.items() if isinstance(v, datetime)})
-
-        # Convert twilight times and flatten keys (nested dictionaries)
-        for twilight_type, times in sun_data.items():
-            if isinstance(times, dict):  # Only process nested twilight dicts
-                for key, value in times.items():
-                    # Simplify the naming, using just the event (e.g., 'civil_dawn', 'civil_dusk')
-                    angles[f"{twilight_type.split('_')[1]}_{key}"] = time_to_angle(value.time())  # Extract time part from datetime
-
-        # print(twilight_times)  # ! debug print
-        # print(sun_data)  # ! debug print
-        # print(angles)  # ! debug print
-
-        # construct plot
-        self.figure.clear()
-        ax = self.figure.add_subplot(111, projection='polar')
-        ax = cast(PolarAxes, ax)
-        ax.set_theta_zero_location('N')  # Midnight at top
-        ax.set_theta_direction(-1)  # Clockwise rotation
-
-        # Full circle for reference
-        full_circle = 2 * np.pi
-
-        # add solar noon and midnight lines to the plot
-        ax.plot([angles['noon'], angles['noon']], [0, 1], color='white', linestyle=':', linewidth=2, alpha=0.8)
-        ax.plot([angles['noon'] + np.pi, angles['noon'] + np.pi], [0, 1], color='black', linestyle=':', linewidth=2, alpha=0.8)
-
-        fill_colors = ['gold', '#0073CF', '#0000CD', '#00008B', '#00004B'] 
-
-        # Fill daylight region
-        daylight_width = (angles['sunset'] - angles['sunrise']) % full_circle
-        ax.bar(angles['sunrise'], 1, width=daylight_width, color=fill_colors[0], alpha=0.8, align='edge')
-
-        # Fill civil twilight regions
-        civil_twilight_width_am = (angles['sunrise'] - angles['civil_dawn']) % full_circle
-        ax.bar(angles['civil_dawn'], 1, width=civil_twilight_width_am, color=fill_colors[1], alpha=0.6, align='edge')
-        civil_twilight_width_pm = (angles['civil_dusk'] - angles['sunset']) % full_circle
-        ax.bar(angles['sunset'], 1, width=civil_twilight_width_pm, color=fill_colors[1], alpha=0.6, align='edge')
-
-        # Fill nautical twilight regions
-        naut_twilight_width_am = (angles['civil_dawn'] - angles['nautical_dawn']) % full_circle
-        ax.bar(angles['nautical_dawn'], 1, width=naut_twilight_width_am, color=fill_colors[2], alpha=0.8, align='edge')
-        naut_twilight_width_pm = (angles['nautical_dusk'] - angles['civil_dusk']) % full_circle
-        ax.bar(angles['civil_dusk'], 1, width=naut_twilight_width_pm, color=fill_colors[2], alpha=0.8, align='edge')
-
-        # Fill astronomical twilight regions
-        astro_twilight_width_am = (angles['nautical_dawn'] - angles['astro_dawn']) % full_circle
-        ax.bar(angles['astro_dawn'], 1, width=astro_twilight_width_am, color=fill_colors[3], alpha=0.8, align='edge')
-        astro_twilight_width_pm = (angles['astro_dusk'] - angles['nautical_dusk']) % full_circle
-        ax.bar(angles['nautical_dusk'], 1, width=astro_twilight_width_pm, color=fill_colors[3], alpha=0.8, align='edge')
-
-        # Fill nighttime region
-        night_width = (angles['astro_dawn'] - angles['astro_dusk']) % full_circle
-        ax.bar(angles['astro_dusk'], 1, width=night_width, color=fill_colors[4], alpha=0.8, align='edge')
-
-        # Set Hour Labels (24-hour format)
-        hour_labels = [f"{h}:00" for h in range(24)]
-        ax.set_xticks(np.linspace(0, 2*np.pi, 24, endpoint=False))
-        ax.set_xticklabels(hour_labels, fontsize=9)
-
-        ax.set_yticks([])
-        ax.set_yticklabels([])
-        ax.yaxis.grid(False)
-        ax.xaxis.grid(False)
+        # Nothing to do if the date and location haven't changed since the last update (or the one in progress)
+        render_key = (self.target_date, self.location_name, self.latitude, self.longitude, self.tz_str)
+        if render_key == self._last_render_key or render_key == self._pending_render_key:
+            return
+        self._last_render_key = None
+
+        # Calculate the sun events in the background; _apply_sun_events updates the plot when they're ready
+        self._pending_render_key = render_key
+        QThreadPool.globalInstance().start(_SunEventsWorker(
+            self._sun_signals, 
+            render_key, 
+            self.latitude, 
+            self.longitude, 
+            self.target_date.toordinal(), 
+            self.tz_str
+        ))
+
+    def _apply_sun_events(self, render_key: tuple, sun_info: Optional[dict], event_times: Optional[list]) -> None:
+        '''
+        **Update the plot with the sun events calculated by a _SunEventsWorker (runs in the GUI thread).**
 
-        r_values = [1, 1.05]  # Slightly outside the filled area
-        for angle in np.linspace(0, 2*np.pi, 24, endpoint=False):
-            ax.plot([angle, angle], r_values, color='black', linewidth=0.8, linestyle='solid')
+        Results for a date or location that has since been replaced by a newer update are ignored.
+        '''
+        if render_key != self._pending_render_key:
+            return
+        self._pending_render_key = None
 
-        # Draw the outer circle at r = 1.05
-        outer_circle = np.linspace(0, full_circle, 100)
-        ax.plot(outer_circle, np.full_like(outer_circle, 1.05), color='black', linewidth=1.2)
+        if sun_info is None or event_times is None:
+            self.show_message("Sun events could not be calculated for this date and location.", QMessageBox.Warning)  # type: ignore
+            return
+        self.sun_info = sun_info
+
+        # Label the plot with the date and location the results were calculated for
+        # (the dialogs may have changed the current ones since the worker was started)
+        target_date, location_name, latitude, longitude, tz_str = render_key
+
+        # Convert all times to angles in one vectorized pass, using the local (wall clock) time of day
+        minutes_of_day = np.fromiter(
+            (value.hour * 60 + value.minute for value in event_times), dtype=np.intp, count=len(_Events._fields)
+        )
+        angles = _MINUTE_ANGLES[minutes_of_day]
+        events = _Events(*angles.tolist())
+
+        # Plot the solar noon and midnight lines
+        self._noon_line.set_xdata([events.noon, events.noon])
+        self._midnight_line.set_xdata([events.noon + np.pi, events.noon + np.pi])
+        self._noon_line.set_visible(True)
+        self._midnight_line.set_visible(True)
+
+        # Resize the shaded regions (daylight, twilights, night), computing all the widths in one pass
+        starts = angles[_WEDGE_STARTS]
+        widths = np.mod(angles[_WEDGE_ENDS] - starts, 2 * np.pi)
+        for wedge, start, width in zip(self._wedges.values(), starts.tolist(), widths.tolist()):
+            wedge.set_x(start)
+            wedge.set_width(width)
 
         # Title
-        loc_str = self.location.name[:13] + '...' if len(self.location.name) > 15 else self.location.name
-        date_str = self.target_date.strftime("%m/%d/%Y")  # Format: MM/DD/YYYY
-        ax.set_title(f"{date_str}: {loc_str} ({self.latitude:.3f}°, {self.longitude:.3f}°, TZ: {self.tz_str})", pad=35, fontsize=12)
+        loc_str = location_name[:13] + '...' if len(location_name) > 15 else location_name
+        date_str = f"{target_date.month:02d}/{target_date.day:02d}/{target_date.year:04d}"  # Format: MM/DD/YYYY
+        self._title.set_text(f"{date_str}: {loc_str} ({latitude:.3f}°, {longitude:.3f}°, TZ: {tz_str})")
+
+        sunrise, sunset = self.sun_info['sunrise'], self.sun_info['sunset']
 
-        # Display length of the day
-        day_length = self.sun_info['sunset'] - self.sun_info['sunrise']
-        day_length_str = str(day_length).split('.')[0]
+        # Display length of the day (H:MM:SS, truncated to whole seconds)
+        day_length = int((sunset - sunrise).total_seconds())
+        day_length_str = f"{day_length // 3600}:{day_length % 3600 // 60:02d}:{day_length % 60:02d}"
 
         # Display sunrise and sunset times
-        sunrise_time_str = self.sun_info['sunrise'].strftime("%H:%M")
-        sunset_time_str = self.sun_info['sunset'].strftime("%H:%M")
+        sunrise_time_str = f"{sunrise.hour:02d}:{sunrise.minute:02d}"  # Format: HH:MM
+        sunset_time_str = f"{sunset.hour:02d}:{sunset.minute:02d}"
 
-        # Add text annotations for sunrise and sunset
-        self.figure.text(0.5, 0.02, f"Sunrise: {sunrise_time_str}    Sunset: {sunset_time_str}    Day Length: {day_length_str}", 
-            ha='center', fontsize=11)
+        # Update text annotations for sunrise and sunset
+        self._footer_text.set_text(f"Sunrise: {sunrise_time_str}    Sunset: {sunset_time_str}    Day Length: {day_length_str}")
 
-        # Apply plot layout adjustments
-        self.figure.subplots_adjust(top=0.85, bottom=0.13, left=0.125, right=0.9, hspace=0.2, wspace=0.2)
+        self._last_render_key = render_key
+
+        if self._background is None:
+            self.canvas.draw_idle()  # No background captured yet, so do a full redraw
+            return
 
-        self.canvas.draw()
+        # Restore the static background and redraw only the artists that changed
+        self.canvas.restore_region(self._background)
+        for artist in self._dynamic_artists:
+            self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
 
 
 if __name__ == "__main__":
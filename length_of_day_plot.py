@@ -1,28 +1,57 @@
 '''
 Create a plot showing the daylight hours for a given date and location.
 '''
+import os
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.projections.polar import PolarAxes
-from typing import cast
+from typing import cast, NamedTuple
 from astral import LocationInfo
 from astral.sun import sun
 from datetime import datetime, time
-import pytz
-
-def time_to_angle(time: time) -> float:
+from zoneinfo import ZoneInfo
+
+# Angle of every minute of the day, for converting the event times by table lookup
+_MINUTE_ANGLES = np.linspace(0, 2*np.pi, 1440, endpoint=False)
+_MINUTE_ANGLES.setflags(write=False)
+
+# Set LOD_HEADLESS to render with Agg and save the plot to a file instead of opening a window
+_HEADLESS = bool(os.environ.get('LOD_HEADLESS'))
+_HEADLESS_FNAME = 'length_of_day.png'
+
+# Fixed event times shown in the plot
+_MIDNIGHT = time(0, 0)
+_NOON = time(12, 0)
+
+# Hour tick positions and labels (24-hour format)
+_HOUR_TICKS = np.linspace(0, 2*np.pi, 24, endpoint=False)
+_HOUR_TICKS.setflags(write=False)
+_HOUR_LABELS = tuple(f"{h}:00" for h in range(24))
+
+# Hour tick marks slightly outside the filled area, as (theta, r) segment endpoints
+_HOUR_TICK_SEGMENTS = np.empty((24, 2, 2))
+_HOUR_TICK_SEGMENTS[:, :, 0] = _HOUR_TICKS[:, np.newaxis]  # theta
+_HOUR_TICK_SEGMENTS[:, 0, 1] = 1  # inner radius
+_HOUR_TICK_SEGMENTS[:, 1, 1] = 1.05  # outer radius
+_HOUR_TICK_SEGMENTS.setflags(write=False)
+
+# Outer circle of the plot at r = 1.05
+_OUTER_CIRCLE_THETA = np.linspace(0, 2*np.pi, 100)
+_OUTER_CIRCLE_THETA.setflags(write=False)
+_OUTER_CIRCLE_R = np.full(100, 1.05)
+_OUTER_CIRCLE_R.setflags(write=False)
+
+class _Events(NamedTuple):
     '''
-    **Convert a time object to an angle in radians.**
-
-    :param time: A time object representing the time of day (hours and minutes).
-    :type time: time
-    :return: A float representing the angle in radians corresponding to the time of day.
-    :rtype: float
+    Events shown in the plot, in the order they are stored in the minutes-of-day array.
     '''
-    return (time.hour + time.minute / 60) / 24 * 2 * np.pi
+    midnight: float
+    noon: float
+    sunrise: float
+    sunset: float
+    first_light: float
+    last_light: float
 
 def _create_plot(
-        times: dict, 
+        minutes_of_day: np.ndarray, 
         location: LocationInfo, 
         target_date: datetime, 
         my_latitude: float, 
@@ -38,8 +67,8 @@ def _create_plot(
 
     https://sffjunkie.github.io/astral/
 
-    :param times: A dictionary containing the times of the events shown in the plot (e.g., sunrise, sunset).
-    :type times: dict
+    :param minutes_of_day: The times (minutes after midnight) of the events shown in the plot, in the order given by *_Events*.
+    :type minutes_of_day: np.ndarray
     :param location: A Location object containing information about the location (name, region, timezone, latitude, longitude).
     :type location: LocationInfo
     :param target_date: The date for which the plot is generated.
@@ -52,48 +81,53 @@ def _create_plot(
     :type sun_info: dict
     '''
     
+    # matplotlib is imported here, so the date prompt in main() appears without waiting for it to load
+    # (otherwise the backend is left to matplotlib, i.e., MPLBACKEND, matplotlibrc, or its default)
+    import matplotlib
+    if _HEADLESS:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.projections.polar import PolarAxes
+
     # Create polar plot
     fig, ax = plt.subplots(figsize=(7, 7), subplot_kw={'projection': 'polar'})
     ax = cast(PolarAxes, ax)  # Tell Pylance that ax is a PolarAxes
     ax.set_theta_zero_location('N')  # Midnight at top
     ax.set_theta_direction(-1)  # Clockwise rotation
 
-    # Full circle for reference
-    full_circle = 2 * np.pi
-
-    angles = {k: time_to_angle(v) for k, v in times.items()}
-
-    # Fill nighttime (dusk to dawn)
-    night_width = (angles['first_light'] - angles['last_light']) % full_circle
-    ax.bar(angles['last_light'], 1, width=night_width, color='darkblue', alpha=0.8, align='edge')
-
-    # Fill twilight regions
-    twilight_width1 = (angles['sunrise'] - angles['first_light']) % full_circle
-    twilight_width2 = (angles['last_light'] - angles['sunset']) % full_circle
-    ax.bar(angles['first_light'], 1, width=twilight_width1, color='midnightblue', alpha=0.6, align='edge')
-    ax.bar(angles['sunset'], 1, width=twilight_width2, color='midnightblue', alpha=0.6, align='edge')
-
-    # Fill daylight region (sunrise to sunset)
-    daylight_width = (angles['sunset'] - angles['sunrise']) % full_circle
-    ax.bar(angles['sunrise'], 1, width=daylight_width, color='gold', alpha=0.8, align='edge')
+    # Convert all event times to angles in one vectorized table lookup
+    events = _Events(*_MINUTE_ANGLES[minutes_of_day].tolist())
+
+    # Regions: nighttime (dusk to dawn), twilight (dawn to sunrise, sunset to dusk), daylight (sunrise to sunset)
+    starts = np.array([events.last_light, events.first_light, events.sunset, events.sunrise])
+    ends = np.array([events.first_light, events.sunrise, events.last_light, events.sunset])
+    widths = np.mod(ends - starts, 2 * np.pi)
+
+    # Fill all four regions with a single bar call (the per-region transparency is baked into the colors)
+    ax.bar(
+        starts, 
+        1, 
+        width=widths, 
+        color=to_rgba_array(['darkblue', 'midnightblue', 'midnightblue', 'gold'], alpha=[0.8, 0.6, 0.6, 0.8]), 
+        align='edge'
+    )
 
     # Set Hour Labels (24-hour format)
-    hour_labels = [f"{h}:00" for h in range(24)]
-    ax.set_xticks(np.linspace(0, 2*np.pi, 24, endpoint=False))
-    ax.set_xticklabels(hour_labels, fontsize=8)
+    ax.set_xticks(_HOUR_TICKS)
+    ax.set_xticklabels(_HOUR_LABELS, fontsize=8)
 
     ax.set_yticks([])  # Remove radial ticks
     ax.set_yticklabels([])  # Remove radial labels
     ax.yaxis.grid(False)  # Remove radial grid lines
     ax.xaxis.grid(False)
 
-    r_values = [1, 1.05]  # Slightly outside the filled area
-    for angle in np.linspace(0, 2*np.pi, 24, endpoint=False):
-        ax.plot([angle, angle], r_values, color='black', linewidth=0.8, linestyle='solid')
+    # Hour tick marks slightly outside the filled area, drawn as a single collection
+    ax.add_collection(LineCollection(_HOUR_TICK_SEGMENTS, colors='black', linewidths=0.8, linestyles='solid'))
 
     # Draw the outer circle at r = 1.05
-    outer_circle = np.linspace(0, full_circle, 100)
-    ax.plot(outer_circle, np.full_like(outer_circle, 1.05), color='black', linewidth=1.2)
+    ax.plot(_OUTER_CIRCLE_THETA, _OUTER_CIRCLE_R, color='black', linewidth=1.2)
 
     # Title
     title_str = location.name[:15] + '...' if len(location.name) > 15 else location.name
@@ -111,7 +145,11 @@ def _create_plot(
     # Add text annotations for sunrise and sunset
     plt.figtext(0.5, 0.01, f"Sunrise: {sunrise_time_str}    Sunset: {sunset_time_str}    Length of Day: {day_length_str}", ha='center', fontsize=12)
 
-    plt.show()
+    if _HEADLESS:
+        fig.savefig(_HEADLESS_FNAME)
+        print(f"Plot saved to {_HEADLESS_FNAME}")
+    else:
+        plt.show()
 
 def main() -> None:
     '''
@@ -154,7 +192,7 @@ def main() -> None:
     )
 
     # Get timezone
-    tz = pytz.timezone(location.timezone)  # pytz timezone object - see https://pypi.org/project/pytz/
+    tz = ZoneInfo(location.timezone)  # zoneinfo timezone object - see https://docs.python.org/3/library/zoneinfo.html
 
     # Get sunrise, sunset, and twilight times
     try:
@@ -166,15 +204,11 @@ def main() -> None:
         print(f"Error: {e}")
         return  # Exit the function
     
-    # Extract event times
-    times: dict = {
-        "midnight": datetime.strptime("00:00", "%H:%M").time(),
-        "noon": datetime.strptime("12:00", "%H:%M").time(),
-        "sunrise": sun_info['sunrise'].time(),
-        "sunset": sun_info['sunset'].time(),
-        "first_light": sun_info['dawn'].time(),
-        "last_light": sun_info['dusk'].time()
-    }
+    # Write the event times straight into an array of minutes after midnight (same order as _Events)
+    event_times = (_MIDNIGHT, _NOON, sun_info['sunrise'], sun_info['sunset'], sun_info['dawn'], sun_info['dusk'])
+    minutes_of_day = np.fromiter(
+        (event_time.hour * 60 + event_time.minute for event_time in event_times), dtype=np.intp, count=len(_Events._fields)
+    )
 
     # Print information
     print(f"Location: {location.name}")
@@ -185,7 +219,7 @@ def main() -> None:
     print(f"Dawn: {sun_info['dawn']}, Dusk: {sun_info['dusk']} (Twilight depression = {twilight_depression}°)")
 
     # Create the plot
-    _create_plot(times, location, target_date, my_latitude, my_longitude, sun_info)
+    _create_plot(minutes_of_day, location, target_date, my_latitude, my_longitude, sun_info)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,221 @@
+'''
+Calculate sunrise, sunset, dawn, and dusk for many dates at once.
+
+Uses the same NOAA solar equations as the astral library (see astral.sun),
+evaluated with NumPy over an array of dates instead of one date at a time.
+'''
+import numpy as np
+
+# Julian day of 2000-01-01 00:00 UTC, and days per Julian century
+_JD_2000 = 2451544.5
+_DAYS_PER_CENTURY = 36525.0
+
+# Using 32 arc minutes as the Sun's apparent diameter (same as astral)
+_SUN_APPARENT_RADIUS = 32.0 / (60.0 * 2.0)
+
+# Result fields, as times of day in UTC
+SUN_EVENTS_DTYPE = np.dtype([
+    ('dawn', 'datetime64[s]'),
+    ('sunrise', 'datetime64[s]'),
+    ('sunset', 'datetime64[s]'),
+    ('dusk', 'datetime64[s]'),
+])
+
+def main() -> None:
+
+    # Day length on the first of each month in Ann Arbor, Michigan
+    dates = np.arange('2025-01', '2026-01', dtype='datetime64[M]').astype('datetime64[D]')
+    events = sun_events_array(dates, 42.22530, -83.74567)
+
+    for day, day_length in zip(dates, events['sunset'] - events['sunrise']):
+        print(f"{day}: {day_length.astype('timedelta64[m]')}")
+
+    # Check the results against astral for a whole year
+    max_diff = check_against_astral(np.arange('2024-01-01', '2025-01-01', dtype='datetime64[D]'))
+    print(f"Matches astral to within {max_diff} s")
+
+
+def check_against_astral(
+        dates: np.ndarray, 
+        locations: tuple = ((42.22530, -83.74567), (-33.87, 151.21), (0.0, 0.0), (63.43, 10.39), (78.22, 15.65)), 
+        depression: float = 6.0, 
+        tolerance: int = 1
+    ) -> int:
+    '''
+    **Check sun_events_array against astral.sun.time_of_transit for each date and location.**
+
+    The default locations include polar ones (Trondheim, Svalbard), where some events don't occur
+    and must be *NaT* exactly when astral raises *ValueError*.
+
+    :param dates: An array of dates.
+    :type dates: np.ndarray
+    :param locations: The (latitude, longitude) pairs to check (°).
+    :type locations: tuple
+    :param depression: The twilight depression angle (°) used for dawn and dusk.
+    :type depression: float
+    :param tolerance: The largest allowed difference (s).
+    :type tolerance: int
+    :return: The largest difference found (s).
+    :rtype: int
+    :raises ValueError: If an event differs by more than *tolerance*, or occurs in only one of the two calculations.
+    '''
+    from astral import Observer, SunDirection
+    from astral.sun import time_of_transit
+
+    transits = (
+        ('dawn', 90.0 + depression, SunDirection.RISING),
+        ('sunrise', 90.0 + _SUN_APPARENT_RADIUS, SunDirection.RISING),
+        ('sunset', 90.0 + _SUN_APPARENT_RADIUS, SunDirection.SETTING),
+        ('dusk', 90.0 + depression, SunDirection.SETTING),
+    )
+
+    max_diff = 0
+    for latitude, longitude in locations:
+        events = sun_events_array(dates, latitude, longitude, depression)
+        observer = Observer(latitude, longitude)
+
+        for i, day in enumerate(np.asarray(dates, dtype='datetime64[D]').tolist()):
+            for name, zenith, direction in transits:
+                try:
+                    expected = np.datetime64(time_of_transit(observer, day, zenith, direction).replace(tzinfo=None), 's')
+                except ValueError:
+                    expected = np.datetime64('NaT', 's')
+
+                actual = events[name][i]
+                if np.isnat(expected) or np.isnat(actual):
+                    if np.isnat(expected) != np.isnat(actual):
+                        raise ValueError(f"{name} at ({latitude}, {longitude}) on {day}: {actual} != {expected}")
+                    continue
+
+                diff = abs(int((actual - expected).astype(np.int64)))
+                if diff > tolerance:
+                    raise ValueError(f"{name} at ({latitude}, {longitude}) on {day}: off by {diff} s")
+                max_diff = max(max_diff, diff)
+
+    return max_diff
+
+
+def sun_events_array(dates: np.ndarray, latitude: float, longitude: float, depression: float = 6.0) -> np.ndarray:
+    '''
+    **Calculate the dawn, sunrise, sunset, and dusk times for an array of dates.**
+
+    Times are in UTC, for the transit nearest each UTC date (the same as *astral.sun.time_of_transit*).
+    Events that don't occur on a date (*e.g.*, the Sun never gets that low) are set to *NaT*.
+
+    :param dates: An array of dates (any *datetime64* unit; the time of day is ignored).
+    :type dates: np.ndarray
+    :param latitude: The latitude of the observer (°).
+    :type latitude: float
+    :param longitude: The longitude of the observer (°).
+    :type longitude: float
+    :param depression: The twilight depression angle (°) used for dawn and dusk.
+    :type depression: float
+    :return: A structured array with the *SUN_EVENTS_DTYPE* fields, one element per date.
+    :rtype: np.ndarray
+    '''
+    days = np.asarray(dates, dtype='datetime64[D]')
+    jd = (days - np.datetime64('2000-01-01', 'D')).astype(np.float64) + _JD_2000
+
+    latitude = min(max(latitude, -89.8), 89.8)
+
+    events = np.empty(days.shape, dtype=SUN_EVENTS_DTYPE)
+    for name, zenith, direction in (
+        ('dawn', 90.0 + depression, 1),
+        ('sunrise', 90.0 + _SUN_APPARENT_RADIUS, 1),
+        ('sunset', 90.0 + _SUN_APPARENT_RADIUS, -1),
+        ('dusk', 90.0 + depression, -1),
+    ):
+        minutes = _time_of_transit(jd, latitude, longitude, zenith + _refraction_at_zenith(zenith), direction)
+        seconds = np.round(minutes * 60.0)
+        valid = np.isfinite(seconds)
+        events[name] = np.where(
+            valid,
+            days + np.where(valid, seconds, 0).astype('timedelta64[s]'),
+            np.datetime64('NaT', 's')
+        )
+
+    return events
+
+
+def _time_of_transit(jd: np.ndarray, latitude: float, longitude: float, zenith: float, direction: int) -> np.ndarray:
+    '''
+    Returns the UTC minutes after midnight at which the Sun crosses the given zenith angle (NaN if it doesn't).
+    '''
+    cos_zenith = np.cos(np.radians(zenith))
+    sin_lat, cos_lat = np.sin(np.radians(latitude)), np.cos(np.radians(latitude))
+
+    # Two passes, refining the Julian day with the previous estimate of the time (as astral does)
+    adjustment = np.zeros_like(jd)
+    time_utc = adjustment
+    for _ in range(2):
+        jc = (jd + adjustment - _JD_2000 - 0.5) / _DAYS_PER_CENTURY
+        declination, eqtime = _declination_and_eq_of_time(jc)
+
+        with np.errstate(invalid='ignore'):
+            hour_angle = np.arccos(
+                (cos_zenith - sin_lat * np.sin(declination)) / (cos_lat * np.cos(declination))
+            ) * direction
+
+        offset = (-longitude - np.degrees(hour_angle)) * 4.0 - eqtime
+        offset = np.where(offset < -720.0, offset + 1440.0, offset)
+
+        time_utc = 720.0 + offset
+        adjustment = time_utc / 1440.0
+
+    return time_utc
+
+
+def _declination_and_eq_of_time(jc: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Returns the Sun's declination (radians) and the equation of time (minutes) for Julian centuries since J2000.
+    '''
+    l0 = np.radians((280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0)  # geometric mean longitude
+    m = np.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))  # geometric mean anomaly
+    e = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)  # eccentricity of Earth's orbit
+
+    # Equation of the center, apparent longitude, and corrected obliquity
+    c = (
+        np.sin(m) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + np.sin(2.0 * m) * (0.019993 - 0.000101 * jc)
+        + np.sin(3.0 * m) * 0.000289
+    )
+    omega = np.radians(125.04 - 1934.136 * jc)
+    apparent_long = np.radians(np.degrees(l0) + c - 0.00569 - 0.00478 * np.sin(omega))
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))
+    obliquity = np.radians(23.0 + (26.0 + seconds / 60.0) / 60.0 + 0.00256 * np.cos(omega))
+
+    declination = np.arcsin(np.sin(obliquity) * np.sin(apparent_long))
+
+    y = np.tan(obliquity / 2.0) ** 2
+    eqtime = np.degrees(
+        y * np.sin(2.0 * l0)
+        - 2.0 * e * np.sin(m)
+        + 4.0 * e * y * np.sin(m) * np.cos(2.0 * l0)
+        - 0.5 * y * y * np.sin(4.0 * l0)
+        - 1.25 * e * e * np.sin(2.0 * m)
+    ) * 4.0
+
+    return declination, eqtime
+
+
+def _refraction_at_zenith(zenith: float) -> float:
+    '''
+    Returns the atmospheric refraction (°) at the given zenith angle (same approximation as astral).
+    '''
+    elevation = 90.0 - zenith
+    if elevation >= 85.0:
+        return 0.0
+
+    te = np.tan(np.radians(elevation))
+    if elevation > 5.0:
+        correction = 58.1 / te - 0.07 / te**3 + 0.000086 / te**5
+    elif elevation > -0.575:
+        correction = 1735.0 + elevation * (-518.2 + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711)))
+    else:
+        correction = -20.774 / te
+
+    return float(correction) / 3600.0
+
+
+if __name__ == "__main__":
+    main()